@@ -6,13 +6,14 @@ All formulas are explicit and traceable back to the report methodology.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from src.parameters import (
     TOTAL_BUSES, EXISTING_BUSES, FUEL_ECONOMY_KG_100KM,
     DAILY_MILEAGE_KM, DAYS_PER_YEAR, EXISTING_TYSELEY_CAPACITY_KG_DAY
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemandResults:
     daily_per_bus_kg:       float
     existing_fleet_daily_kg: float
@@ -23,6 +24,7 @@ class DemandResults:
     annual_fleet_mileage_km: float
 
 
+@lru_cache(maxsize=256)
 def calculate_demand(
     total_buses:      int   = TOTAL_BUSES,
     fuel_economy:     float = FUEL_ECONOMY_KG_100KM,
@@ -55,11 +57,15 @@ def calculate_demand(
     annual_mileage = total_buses * daily_mileage_km * DAYS_PER_YEAR   # km/year
 
     return DemandResults(
-        daily_per_bus_kg=round(daily_per_bus, 2),
-        existing_fleet_daily_kg=round(existing_fleet_daily, 1),
-        full_fleet_daily_kg=round(full_fleet_daily, 1),
-        supply_gap_kg_day=round(supply_gap, 1),
-        annual_total_kg=round(annual_total, 0),
-        annual_total_tonnes=round(annual_total / 1_000, 1),
-        annual_fleet_mileage_km=round(annual_mileage, 0),
+        daily_per_bus_kg=daily_per_bus,
+        existing_fleet_daily_kg=existing_fleet_daily,
+        full_fleet_daily_kg=full_fleet_daily,
+        supply_gap_kg_day=supply_gap,
+        annual_total_kg=annual_total,
+        annual_total_tonnes=annual_total / 1_000,
+        annual_fleet_mileage_km=annual_mileage,
     )
+
+
+# Baseline demand, computed once at import and shared by emissions/economics
+DEFAULT_DEMAND = calculate_demand()
@@ -10,61 +10,188 @@ Benefit streams for NPV:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional – the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from src.parameters import (
     ELECTRICITY_PRICE_GBP_MWH, ELECTROLYSER_EFFICIENCY_KWH_KG,
-    ELECTROLYSER_LIFETIME_YR, NEW_ELECTROLYSER_MWE, ELECTROLYSER_YIELD,
+    ELECTROLYSER_LIFETIME_YR,
     DISCOUNT_RATE, PROJECT_LIFE_YR,
     TRANSPORT_COST_GBP_KG, HRS_OPEX_GBP_KG,
     DIESEL_PRICE_GBP_LITRE, DIESEL_FUEL_ECONOMY_KM_L,
-    DAILY_MILEAGE_KM, TOTAL_BUSES, DAYS_PER_YEAR,
+    ANNUAL_DIESEL_LITRES, ANNUAL_NEW_PRODUCTION_KG,
     ELECTROLYSER_OPEX_FRAC, STACK_REPLACEMENT_FRACTION,
     OPERATING_HOURS_PER_YR, CARBON_PRICE_BASELINE,
     ELECTROLYSER_COST_PER_KW, BOP_FRACTION,
 )
-from src.demand import calculate_demand
-from src.infrastructure import calculate_capex
-from src.emissions import calculate_emissions
+from src.demand import DEFAULT_DEMAND, DemandResults
+from src.infrastructure import InfrastructureCapex, _capex_terms, calculate_capex
+from src.emissions import EmissionsResults, calculate_emissions, calculate_emissions_vec
+
+# Baseline CAPEX, computed once; reused whenever cost/kW and BoP are not overridden
+_DEFAULT_CAPEX = calculate_capex()
 
 
 # ── helpers ──────────────────────────────────────────────────────────────────
 
 def _annuity_factor(rate: float, n_years: int) -> float:
     """Capital recovery factor (annuity factor) for given WACC and project life."""
-    if rate == 0:
-        return n_years
-    return (rate * (1 + rate) ** n_years) / ((1 + rate) ** n_years - 1)
+    if np.ndim(rate) == 0:
+        if rate == 0:
+            return n_years
+        growth = (1 + rate) ** n_years
+        return (rate * growth) / (growth - 1)
+    # Arrays: same zero-rate value as the scalar path, elementwise
+    growth = (1 + rate) ** n_years
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rate == 0, n_years, (rate * growth) / (growth - 1))
+
+
+# Scalar sweeps revisit the same (rate, life) pair; arrays go through _annuity_factor
+_annuity_factor_cached = lru_cache(maxsize=64)(_annuity_factor)
+
 
+def _pv_annuity_factor(rate: float, n_years: int) -> float:
+    """Present value of £1 received at the end of each year for n_years."""
+    if np.ndim(rate) == 0:
+        if rate == 0:
+            return n_years
+        return (1 - (1 + rate) ** -n_years) / rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rate == 0, n_years, (1 - (1 + rate) ** -n_years) / rate)
 
+
+# Sum of the year-1..N discount factors; scalar NPV calls share one value per (rate, life)
+_pv_annuity_factor_cached = lru_cache(maxsize=64)(_pv_annuity_factor)
+
+
+@njit(cache=True)
 def _npv(cash_flows: np.ndarray, discount_rate: float) -> float:
-    """Net present value of a cash-flow array (index 0 = year 0 = CAPEX outlay)."""
-    t = np.arange(len(cash_flows))
-    return float(np.sum(cash_flows / (1 + discount_rate) ** t))
+    """
+    Net present value of a cash-flow array (index 0 = year 0 = CAPEX outlay).
+    Evaluated as a Horner polynomial in 1/(1+r): one reciprocal, no powers.
+    """
+    inv = 1.0 / (1.0 + discount_rate)
+    acc = 0.0
+    for i in range(len(cash_flows) - 1, -1, -1):
+        acc = acc * inv + cash_flows[i]
+    return float(acc)
 
 
-def _irr(cash_flows: np.ndarray) -> Optional[float]:
+def _annuity_irr(outlay: float, benefit: float, n_years: int,
+                 lo: float = -0.5, hi: float = 2.0) -> Optional[float]:
     """
-    Internal rate of return via bisection on NPV(r) = 0.
-    Searches in the range [-50%, +200%] which covers all practical project IRRs.
-    Returns None if no sign change found in that range (project never breaks even).
+    IRR of a single outlay followed by a level annuity, i.e. the rate r solving
+
+        outlay = benefit × (1 - (1+r)^-N) / r
+
+    The annuity factor falls monotonically with r, so a bracketed Newton
+    iteration on plain floats converges in a handful of steps.
+    Returns None if the root lies outside [lo, hi] (same contract as _irr).
     """
-    def npv_at_rate(r):
-        t = np.arange(len(cash_flows))
-        return float(np.sum(cash_flows / (1 + r) ** t))
+    if benefit <= 0:
+        return None  # NPV is negative at every rate
+    target = outlay / benefit
+
+    def excess_and_slope(r):
+        # annuity factor minus target, and its derivative w.r.t. r
+        if abs(r) < 1e-9:
+            return n_years - target, -n_years * (n_years + 1) / 2
+        g = (1 + r) ** -n_years
+        a = (1 - g) / r
+        return a - target, (n_years * g / (1 + r) - a) / r
+
+    f_lo, _ = excess_and_slope(lo)
+    f_hi, _ = excess_and_slope(hi)
+    if f_lo * f_hi > 0:
+        return None  # no sign change → no real IRR in range
+
+    r = min(max(0.1, lo), hi)
+    for _ in range(50):
+        f, df = excess_and_slope(r)
+        if f > 0:
+            lo = r
+        else:
+            hi = r
+        step = f / df
+        r_new = r - step
+        if not lo < r_new < hi:
+            r_new = (lo + hi) / 2  # Newton left the bracket → bisect instead
+        if abs(r_new - r) < 1e-12:
+            return r_new
+        r = r_new
+    return r
+
 
+# LLVM fast-math flags for the pure-arithmetic kernels; "nnan"/"ninf" are left
+# out so the NaN failure signal used by the IRR solvers survives compilation
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _npv_and_slope(cash_flows: np.ndarray, rate: float):
+    """
+    NPV and dNPV/dr in a single Horner pass.
+    With v = 1/(1+r), NPV = P(v) = Σ cf_t v^t and dNPV/dr = -v² P'(v).
+    """
+    v = 1.0 / (1.0 + rate)
+    p = 0.0
+    dp = 0.0
+    for i in range(len(cash_flows) - 1, -1, -1):
+        dp = dp * v + p
+        p = p * v + cash_flows[i]
+    return p, -v * v * dp
+
+
+@njit(cache=True)
+def _irr_newton(cash_flows: np.ndarray, guess: float = 0.1,
+                lo: float = -0.5, hi: float = 2.0, maxiter: int = 50) -> float:
+    """
+    Newton-Raphson on NPV(r) = 0 using the analytic derivative.
+    Returns NaN if the iteration stalls or leaves [lo, hi].
+    """
+    r = guess
+    for _ in range(maxiter):
+        npv, slope = _npv_and_slope(cash_flows, r)
+        if abs(npv) < 1.0:  # converged to within £1
+            return r
+        if slope == 0.0:
+            return np.nan
+        r -= npv / slope
+        if r < lo or r > hi:
+            return np.nan
+    return np.nan
+
+
+@njit(cache=True)
+def _irr_numba(cash_flows: np.ndarray, lo: float, hi: float) -> float:
+    """
+    IRR kernel for _irr, compiled with numba when it is installed: Newton first,
+    bisection if Newton fails. Returns NaN if NPV does not change sign between lo and hi.
+    """
     # Check for sign change (necessary for IRR to exist)
-    lo, hi = -0.5, 2.0
-    npv_lo = npv_at_rate(lo)
-    npv_hi = npv_at_rate(hi)
+    npv_lo = _npv(cash_flows, lo)
+    npv_hi = _npv(cash_flows, hi)
     if npv_lo * npv_hi > 0:
-        return None  # no sign change → no real IRR in range
+        return np.nan  # no sign change → no real IRR in range
+
+    r = _irr_newton(cash_flows, 0.1, lo, hi)
+    if not np.isnan(r):
+        return r
 
     # Bisection
     for _ in range(100):
         mid = (lo + hi) / 2
-        npv_mid = npv_at_rate(mid)
+        npv_mid = _npv(cash_flows, mid)
         if abs(npv_mid) < 1.0:  # converged to within £1
             return mid
         if npv_lo * npv_mid < 0:
@@ -75,9 +202,68 @@ def _irr(cash_flows: np.ndarray) -> Optional[float]:
     return (lo + hi) / 2
 
 
+def _annuity_irr_vec(outlay: float, benefit: np.ndarray, n_years: int,
+                     lo: float = -0.5, hi: float = 2.0) -> np.ndarray:
+    """
+    _annuity_irr over an array of annual benefits: the same bracketed Newton
+    iteration, run elementwise until every point has converged.
+    Returns NaN where _annuity_irr would return None.
+    """
+    benefit = np.asarray(benefit, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        target = outlay / benefit
+
+        def excess_and_slope(r):
+            g = (1 + r) ** -n_years
+            a = (1 - g) / r
+            near_zero = np.abs(r) < 1e-9
+            f = np.where(near_zero, n_years - target, a - target)
+            df = np.where(near_zero, -n_years * (n_years + 1) / 2, (n_years * g / (1 + r) - a) / r)
+            return f, df
+
+        lo = np.full(benefit.shape, lo)
+        hi = np.full(benefit.shape, hi)
+        f_lo, _ = excess_and_slope(lo)
+        f_hi, _ = excess_and_slope(hi)
+        valid = (benefit > 0) & (f_lo * f_hi <= 0)
+
+        r = np.clip(0.1, lo, hi)
+        active = valid.copy()
+        for _ in range(50):
+            if not active.any():
+                break
+            f, df = excess_and_slope(r)
+            lo = np.where(active & (f > 0), r, lo)
+            hi = np.where(active & (f <= 0), r, hi)
+            r_new = r - f / df
+            r_new = np.where((lo < r_new) & (r_new < hi), r_new, (lo + hi) / 2)  # bisect if outside
+            converged = np.abs(r_new - r) < 1e-12
+            r = np.where(active, r_new, r)
+            active &= ~converged
+    return np.where(valid, r, np.nan)
+
+
+def _irr(cash_flows: np.ndarray) -> Optional[float]:
+    """
+    Internal rate of return: the root of NPV(r) = 0.
+    Searches in the range [-50%, +200%] which covers all practical project IRRs.
+    Returns None if no sign change found in that range (project never breaks even).
+
+    Cash flows of the form [-CAPEX, B, B, ..., B] are solved analytically
+    by _annuity_irr; irregular profiles use Newton with bisection as fallback.
+    """
+    if (len(cash_flows) > 1 and cash_flows[0] < 0
+            and np.all(cash_flows[1:] == cash_flows[1])):
+        return _annuity_irr(-float(cash_flows[0]), float(cash_flows[1]), len(cash_flows) - 1)
+
+    cf = np.ascontiguousarray(cash_flows, dtype=np.float64)
+    irr_val = _irr_numba(cf, -0.5, 2.0)
+    return None if np.isnan(irr_val) else irr_val
+
+
 # ── main functions ────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LCOHBreakdown:
     electricity_cost_gbp_kg:   float
     capex_amortised_gbp_kg:    float
@@ -89,6 +275,71 @@ class LCOHBreakdown:
     total_dispensed_cost_gbp_kg: float
 
 
+def _lcoh_terms(
+    electricity_price_gbp_mwh,
+    discount_rate,
+    electrolyser_efficiency_kwh_kg,
+    electrolyser_cost_per_kw,
+    bop_fraction,
+    transport_cost_gbp_kg,
+    hrs_opex_gbp_kg_override,
+) -> dict:
+    """LCOH components keyed by LCOHBreakdown field; every argument may be a NumPy array."""
+    # Resolve effective parameter values
+    eff      = electrolyser_efficiency_kwh_kg if electrolyser_efficiency_kwh_kg is not None else ELECTROLYSER_EFFICIENCY_KWH_KG
+    cost_kw  = electrolyser_cost_per_kw       if electrolyser_cost_per_kw       is not None else ELECTROLYSER_COST_PER_KW
+    bop_frac = bop_fraction                   if bop_fraction                   is not None else BOP_FRACTION
+    trans    = transport_cost_gbp_kg          if transport_cost_gbp_kg          is not None else TRANSPORT_COST_GBP_KG
+    hrs_opex = hrs_opex_gbp_kg_override       if hrs_opex_gbp_kg_override       is not None else HRS_OPEX_GBP_KG
+
+    # Recalculate electrolyser CAPEX only if cost/kW or BoP fraction is overridden
+    if electrolyser_cost_per_kw is None and bop_fraction is None:
+        electrolyser_capex = _DEFAULT_CAPEX.electrolyser_total_gbp
+    else:
+        electrolyser_capex = _capex_terms(
+            electrolyser_cost_per_kw=cost_kw,
+            bop_fraction=bop_frac,
+        )["electrolyser_total_gbp"]
+
+    # Annual H2 production from new electrolyser
+    annual_prod_kg = ANNUAL_NEW_PRODUCTION_KG
+
+    # 1. Electricity cost
+    elec_gbp_kwh    = electricity_price_gbp_mwh / 1_000
+    electricity_cost = eff * elec_gbp_kwh                                       # £/kg
+
+    # 2. CAPEX amortised using capital recovery factor
+    if np.isscalar(discount_rate):
+        crf = _annuity_factor_cached(discount_rate, ELECTROLYSER_LIFETIME_YR)
+    else:
+        crf = _annuity_factor(discount_rate, ELECTROLYSER_LIFETIME_YR)
+    annual_capex_charge = electrolyser_capex * crf
+    capex_per_kg = annual_capex_charge / annual_prod_kg                         # £/kg
+
+    # 3. Non-energy OPEX
+    annual_opex = electrolyser_capex * ELECTROLYSER_OPEX_FRAC
+    opex_per_kg = annual_opex / annual_prod_kg                                  # £/kg
+
+    # 4. Stack replacement (annualised)
+    annual_stack = electrolyser_capex * (STACK_REPLACEMENT_FRACTION / 10)
+    stack_per_kg = annual_stack / annual_prod_kg                                # £/kg
+
+    production_lcoh = electricity_cost + capex_per_kg + opex_per_kg + stack_per_kg
+    total_cost      = production_lcoh + trans + hrs_opex
+
+    return dict(
+        electricity_cost_gbp_kg=electricity_cost,
+        capex_amortised_gbp_kg=capex_per_kg,
+        opex_non_energy_gbp_kg=opex_per_kg,
+        stack_replacement_gbp_kg=stack_per_kg,
+        production_lcoh_gbp_kg=production_lcoh,
+        transport_gbp_kg=trans,
+        hrs_opex_gbp_kg=hrs_opex,
+        total_dispensed_cost_gbp_kg=total_cost,
+    )
+
+
+@lru_cache(maxsize=8192)
 def calculate_lcoh(
     electricity_price_gbp_mwh:  float = ELECTRICITY_PRICE_GBP_MWH,
     discount_rate:               float = DISCOUNT_RATE,
@@ -114,56 +365,93 @@ def calculate_lcoh(
     to override individual parameters for sensitivity analysis — this avoids the
     Python "from ... import" local-binding issue that breaks monkey-patching.
     """
-    # Resolve effective parameter values
-    eff      = electrolyser_efficiency_kwh_kg if electrolyser_efficiency_kwh_kg is not None else ELECTROLYSER_EFFICIENCY_KWH_KG
-    cost_kw  = electrolyser_cost_per_kw       if electrolyser_cost_per_kw       is not None else ELECTROLYSER_COST_PER_KW
-    bop_frac = bop_fraction                   if bop_fraction                   is not None else BOP_FRACTION
-    trans    = transport_cost_gbp_kg          if transport_cost_gbp_kg          is not None else TRANSPORT_COST_GBP_KG
-    hrs_opex = hrs_opex_gbp_kg_override       if hrs_opex_gbp_kg_override       is not None else HRS_OPEX_GBP_KG
+    return LCOHBreakdown(**_lcoh_terms(
+        electricity_price_gbp_mwh, discount_rate,
+        electrolyser_efficiency_kwh_kg, electrolyser_cost_per_kw, bop_fraction,
+        transport_cost_gbp_kg, hrs_opex_gbp_kg_override,
+    ))
+
+
+def calculate_lcoh_vec(
+    electricity_price_gbp_mwh:  np.ndarray = ELECTRICITY_PRICE_GBP_MWH,
+    discount_rate:               np.ndarray = DISCOUNT_RATE,
+    electrolyser_efficiency_kwh_kg: Optional[np.ndarray] = None,
+    electrolyser_cost_per_kw:       Optional[np.ndarray] = None,
+    bop_fraction:                   Optional[np.ndarray] = None,
+    transport_cost_gbp_kg:          Optional[np.ndarray] = None,
+    hrs_opex_gbp_kg_override:       Optional[np.ndarray] = None,
+    lcoh_params:                    Optional[np.ndarray] = None,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorised calculate_lcoh: any argument may be an array (typically the
+    electricity price sweep), and all arguments broadcast against each other.
+
+    `lcoh_params` replaces the five overrides in one go: an array laid out like
+    parameters.LCOH_PARAMS (efficiency, £/kW, BoP fraction, transport, HRS OPEX),
+    either shape (5,) or (5, ...) for a stack of scenarios.
 
-    # Recalculate electrolyser CAPEX with potentially overridden cost/kW and BoP fraction
-    from src.infrastructure import calculate_capex
-    capex = calculate_capex(
-        electrolyser_cost_per_kw=cost_kw,
-        bop_fraction=bop_frac,
+    Returns a dict keyed by the LCOHBreakdown field names, each value an array
+    of the broadcast shape. Use this for sweeps instead of calling
+    calculate_lcoh once per point.
+    """
+    if lcoh_params is not None:
+        (electrolyser_efficiency_kwh_kg, electrolyser_cost_per_kw, bop_fraction,
+         transport_cost_gbp_kg, hrs_opex_gbp_kg_override) = np.asarray(lcoh_params, dtype=np.float64)
+    terms = _lcoh_terms(
+        electricity_price_gbp_mwh, discount_rate,
+        electrolyser_efficiency_kwh_kg, electrolyser_cost_per_kw, bop_fraction,
+        transport_cost_gbp_kg, hrs_opex_gbp_kg_override,
     )
+    shape = np.broadcast_shapes(*(np.shape(value) for value in terms.values()))
+    return {name: np.broadcast_to(value, shape).astype(np.float64) for name, value in terms.items()}
 
-    # Annual H2 production from new electrolyser
-    annual_prod_kg = NEW_ELECTROLYSER_MWE * ELECTROLYSER_YIELD * DAYS_PER_YEAR
 
-    # 1. Electricity cost
-    elec_gbp_kwh    = electricity_price_gbp_mwh / 1_000
-    electricity_cost = eff * elec_gbp_kwh                                       # £/kg
+_LCOH_SWEEP_PARAMS = (
+    "electricity_price_gbp_mwh", "discount_rate",
+    "electrolyser_efficiency_kwh_kg", "electrolyser_cost_per_kw", "bop_fraction",
+    "transport_cost_gbp_kg", "hrs_opex_gbp_kg_override",
+)
 
-    # 2. CAPEX amortised using capital recovery factor
-    crf = _annuity_factor(discount_rate, ELECTROLYSER_LIFETIME_YR)
-    annual_capex_charge = capex.electrolyser_total_gbp * crf
-    capex_per_kg = annual_capex_charge / annual_prod_kg                         # £/kg
 
-    # 3. Non-energy OPEX
-    annual_opex = capex.electrolyser_total_gbp * ELECTROLYSER_OPEX_FRAC
-    opex_per_kg = annual_opex / annual_prod_kg                                  # £/kg
+def calculate_lcoh_batch(param_name: str, values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    LCOH components for a sweep of one calculate_lcoh parameter, all others at baseline.
 
-    # 4. Stack replacement (annualised)
-    annual_stack = capex.electrolyser_total_gbp * (STACK_REPLACEMENT_FRACTION / 10)
-    stack_per_kg = annual_stack / annual_prod_kg                                # £/kg
+    Returns one array per LCOHBreakdown field (struct-of-arrays), each shaped like
+    `values`, ready to pass straight to matplotlib.
+    """
+    if param_name not in _LCOH_SWEEP_PARAMS:
+        raise ValueError(f"Unknown calculate_lcoh parameter: {param_name!r}")
+    return calculate_lcoh_vec(**{param_name: np.asarray(values, dtype=np.float64)})
 
-    production_lcoh = electricity_cost + capex_per_kg + opex_per_kg + stack_per_kg
-    total_cost      = production_lcoh + trans + hrs_opex
 
-    return LCOHBreakdown(
-        electricity_cost_gbp_kg=round(electricity_cost, 3),
-        capex_amortised_gbp_kg=round(capex_per_kg, 3),
-        opex_non_energy_gbp_kg=round(opex_per_kg, 3),
-        stack_replacement_gbp_kg=round(stack_per_kg, 3),
-        production_lcoh_gbp_kg=round(production_lcoh, 3),
-        transport_gbp_kg=round(trans, 3),
-        hrs_opex_gbp_kg=round(hrs_opex, 3),
-        total_dispensed_cost_gbp_kg=round(total_cost, 3),
-    )
+def specialize_lcoh(param_name: str) -> Callable[[float], float]:
+    """
+    Partially evaluate total dispensed LCOH for a sweep of one parameter,
+    all others held at baseline.
+
+    Every parameter except the discount rate enters the LCOH linearly, so the
+    returned closure is `lambda v: base + slope * v` with everything else folded
+    into two float constants. The discount rate acts through the capital
+    recovery factor and falls back to the full calculation. The closure accepts
+    floats or NumPy arrays.
+    """
+    if param_name not in _LCOH_SWEEP_PARAMS:
+        raise ValueError(f"Unknown calculate_lcoh parameter: {param_name!r}")
 
+    if param_name == "discount_rate":
+        def lcoh_at_rate(rate):
+            if np.ndim(rate) == 0:
+                return calculate_lcoh(discount_rate=rate).total_dispensed_cost_gbp_kg
+            return calculate_lcoh_vec(discount_rate=rate)["total_dispensed_cost_gbp_kg"]
+        return lcoh_at_rate
 
-@dataclass
+    base  = calculate_lcoh(**{param_name: 0.0}).total_dispensed_cost_gbp_kg
+    slope = calculate_lcoh(**{param_name: 1.0}).total_dispensed_cost_gbp_kg - base
+    return lambda value: base + slope * value
+
+
+@dataclass(slots=True, frozen=True)
 class AnnualCosts:
     h2_fuel_cost_gbp:     float
     diesel_fuel_cost_gbp: float
@@ -173,44 +461,91 @@ class AnnualCosts:
     total_annual_benefit_gbp: float
 
 
-def calculate_annual_costs(
-    electricity_price_gbp_mwh: float = ELECTRICITY_PRICE_GBP_MWH,
-    carbon_price_gbp_tonne: float = CARBON_PRICE_BASELINE,
-    diesel_price_gbp_litre: float = DIESEL_PRICE_GBP_LITRE,
-) -> AnnualCosts:
-    """
-    Compare annual fuel costs (H2 vs diesel) and carbon cost savings.
-    """
-    demand  = calculate_demand()
-    lcoh    = calculate_lcoh(electricity_price_gbp_mwh)
-    emis    = calculate_emissions(electricity_price_gbp_mwh)
-
+def _annual_cost_terms(
+    h2_price_gbp_kg,
+    co2_saved_tonnes,
+    carbon_price_gbp_tonne,
+    diesel_price_gbp_litre,
+    annual_h2_kg,
+    annual_diesel_litres,
+) -> dict:
+    """Annual cost components keyed by AnnualCosts field; every argument may be a NumPy array."""
     # H2 total annual fuel cost
-    h2_cost = demand.annual_total_kg * lcoh.total_dispensed_cost_gbp_kg
+    h2_cost = annual_h2_kg * h2_price_gbp_kg
 
     # Diesel equivalent annual fuel cost
-    total_diesel_litres = (TOTAL_BUSES * DAILY_MILEAGE_KM * DAYS_PER_YEAR) / DIESEL_FUEL_ECONOMY_KM_L
-    diesel_cost = total_diesel_litres * diesel_price_gbp_litre
+    diesel_cost = annual_diesel_litres * diesel_price_gbp_litre
 
     fuel_saving = diesel_cost - h2_cost
 
     # Carbon cost saved
-    co2_saved = emis.co2_saving_tonnes_yr
-    carbon_value = co2_saved * carbon_price_gbp_tonne
+    carbon_value = co2_saved_tonnes * carbon_price_gbp_tonne
 
     total_benefit = fuel_saving + carbon_value
 
-    return AnnualCosts(
-        h2_fuel_cost_gbp=round(h2_cost, 0),
-        diesel_fuel_cost_gbp=round(diesel_cost, 0),
-        fuel_saving_gbp=round(fuel_saving, 0),
-        carbon_saving_tonnes=round(co2_saved, 1),
-        carbon_saving_value_gbp=round(carbon_value, 0),
-        total_annual_benefit_gbp=round(total_benefit, 0),
+    return dict(
+        h2_fuel_cost_gbp=h2_cost,
+        diesel_fuel_cost_gbp=diesel_cost,
+        fuel_saving_gbp=fuel_saving,
+        carbon_saving_tonnes=co2_saved_tonnes,
+        carbon_saving_value_gbp=carbon_value,
+        total_annual_benefit_gbp=total_benefit,
     )
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def calculate_annual_costs(
+    electricity_price_gbp_mwh: float = ELECTRICITY_PRICE_GBP_MWH,
+    carbon_price_gbp_tonne: float = CARBON_PRICE_BASELINE,
+    diesel_price_gbp_litre: float = DIESEL_PRICE_GBP_LITRE,
+    demand: Optional[DemandResults] = None,
+    lcoh:   Optional[LCOHBreakdown] = None,
+    emis:   Optional[EmissionsResults] = None,
+) -> AnnualCosts:
+    """
+    Compare annual fuel costs (H2 vs diesel) and carbon cost savings.
+
+    `demand`, `lcoh` and `emis` may be passed in when the caller has already
+    computed them for the same electricity price; otherwise they are derived here.
+    A non-default `demand` (another fleet size or duty cycle) sets the H2 volume,
+    the displaced diesel litres and, unless `emis` is given, the CO2 saving.
+    """
+    if demand is None:
+        demand = DEFAULT_DEMAND
+    if lcoh is None:
+        lcoh = calculate_lcoh(electricity_price_gbp_mwh)
+    if emis is None:
+        emis = calculate_emissions(electricity_price_gbp_mwh, demand)
+
+    annual_diesel_litres = demand.annual_fleet_mileage_km / DIESEL_FUEL_ECONOMY_KM_L
+    return AnnualCosts(**_annual_cost_terms(
+        lcoh.total_dispensed_cost_gbp_kg, emis.co2_saving_tonnes_yr,
+        carbon_price_gbp_tonne, diesel_price_gbp_litre,
+        demand.annual_total_kg, annual_diesel_litres,
+    ))
+
+
+def calculate_annual_costs_vec(
+    electricity_price_gbp_mwh: np.ndarray = ELECTRICITY_PRICE_GBP_MWH,
+    carbon_price_gbp_tonne:    np.ndarray = CARBON_PRICE_BASELINE,
+    diesel_price_gbp_litre:    np.ndarray = DIESEL_PRICE_GBP_LITRE,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorised calculate_annual_costs: the three prices broadcast against each
+    other. Returns a dict keyed by the AnnualCosts field names.
+    """
+    lcoh_total = calculate_lcoh_vec(electricity_price_gbp_mwh)["total_dispensed_cost_gbp_kg"]
+    co2_saved = calculate_emissions_vec(electricity_price_gbp_mwh)["co2_saving_tonnes_yr"]
+    terms = _annual_cost_terms(
+        lcoh_total, co2_saved,
+        carbon_price_gbp_tonne, diesel_price_gbp_litre,
+        DEFAULT_DEMAND.annual_total_kg, ANNUAL_DIESEL_LITRES,
+    )
+    shape = np.broadcast_shapes(*(np.shape(value) for value in terms.values()))
+    return {name: np.broadcast_to(value, shape).astype(np.float64) for name, value in terms.items()}
+
+
+@dataclass(slots=True, frozen=True)
 class FinancialAnalysis:
     total_capex_gbp:       float
     annual_benefit_gbp:    float
@@ -220,12 +555,15 @@ class FinancialAnalysis:
     benefit_cost_ratio:    float
 
 
+@lru_cache(maxsize=8192)
 def calculate_npv_irr(
     electricity_price_gbp_mwh: float = ELECTRICITY_PRICE_GBP_MWH,
     carbon_price_gbp_tonne: float = CARBON_PRICE_BASELINE,
     discount_rate: float = DISCOUNT_RATE,
     project_life_yr: int = PROJECT_LIFE_YR,
     diesel_price_gbp_litre: float = DIESEL_PRICE_GBP_LITRE,
+    capex: Optional[InfrastructureCapex] = None,
+    costs: Optional[AnnualCosts] = None,
 ) -> FinancialAnalysis:
     """
     NPV and IRR for the £24M+ infrastructure investment.
@@ -237,38 +575,111 @@ def calculate_npv_irr(
 
     Annual benefits increase slightly with inflation but we use real (inflation-adjusted)
     cash flows at a real discount rate for simplicity.
+
+    Pre-computed `capex` and `costs` (for the same prices) can be passed in to
+    skip recomputing them.
     """
-    capex = calculate_capex()
-    costs = calculate_annual_costs(
-        electricity_price_gbp_mwh, carbon_price_gbp_tonne, diesel_price_gbp_litre
-    )
+    if capex is None:
+        capex = _DEFAULT_CAPEX
+    if costs is None:
+        costs = calculate_annual_costs(
+            electricity_price_gbp_mwh, carbon_price_gbp_tonne, diesel_price_gbp_litre
+        )
 
     total_capex = capex.total_capex_gbp
     annual_benefit = costs.total_annual_benefit_gbp
 
-    # Build cash flow array: [year0, year1, ..., yearN]
-    cash_flows = np.array([-total_capex] + [annual_benefit] * project_life_yr)
+    # Level annuity of benefits → NPV needs only the PV annuity factor
+    pv_benefits = annual_benefit * _pv_annuity_factor_cached(discount_rate, project_life_yr)
+    npv = pv_benefits - total_capex
 
-    npv = _npv(cash_flows, discount_rate)
+    # Build cash flow array for IRR: [year0, year1, ..., yearN]
+    cash_flows = np.full(project_life_yr + 1, annual_benefit, dtype=np.float64)
+    cash_flows[0] = -total_capex
     irr_val = _irr(cash_flows)
-    irr_pct = round(irr_val * 100, 2) if irr_val is not None else None
+    irr_pct = irr_val * 100 if irr_val is not None else None
 
     simple_payback = total_capex / annual_benefit if annual_benefit > 0 else float("inf")
 
     # Benefit-cost ratio: PV of benefits / CAPEX
-    pv_benefits = annual_benefit * ((1 - (1 + discount_rate) ** -project_life_yr) / discount_rate)
     bcr = pv_benefits / total_capex
 
     return FinancialAnalysis(
-        total_capex_gbp=round(total_capex, 0),
-        annual_benefit_gbp=round(annual_benefit, 0),
-        npv_gbp=round(npv, 0),
+        total_capex_gbp=total_capex,
+        annual_benefit_gbp=annual_benefit,
+        npv_gbp=npv,
         irr_pct=irr_pct,
-        simple_payback_yr=round(simple_payback, 1),
-        benefit_cost_ratio=round(bcr, 3),
+        simple_payback_yr=simple_payback,
+        benefit_cost_ratio=bcr,
+    )
+
+
+def calculate_npv_vec(
+    electricity_price_gbp_mwh: np.ndarray = ELECTRICITY_PRICE_GBP_MWH,
+    carbon_price_gbp_tonne:    np.ndarray = CARBON_PRICE_BASELINE,
+    discount_rate:             np.ndarray = DISCOUNT_RATE,
+    project_life_yr:           int = PROJECT_LIFE_YR,
+    diesel_price_gbp_litre:    np.ndarray = DIESEL_PRICE_GBP_LITRE,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorised NPV over broadcast price grids, e.g. `elec[None, :]` against
+    `carbon[:, None]` for a heatmap.
+
+    Returns the FinancialAnalysis fields that are closed-form in the prices
+    (total_capex_gbp, annual_benefit_gbp, npv_gbp, benefit_cost_ratio). IRR needs
+    a root solve per point, so it stays with calculate_npv_irr.
+    """
+    annual_benefit = calculate_annual_costs_vec(
+        electricity_price_gbp_mwh, carbon_price_gbp_tonne, diesel_price_gbp_litre
+    )["total_annual_benefit_gbp"]
+    total_capex = _DEFAULT_CAPEX.total_capex_gbp
+
+    if np.isscalar(discount_rate):
+        pvaf = _pv_annuity_factor_cached(discount_rate, project_life_yr)
+    else:
+        pvaf = _pv_annuity_factor(discount_rate, project_life_yr)
+    pv_benefits = annual_benefit * pvaf
+    terms = dict(
+        total_capex_gbp=total_capex,
+        annual_benefit_gbp=annual_benefit,
+        npv_gbp=pv_benefits - total_capex,
+        benefit_cost_ratio=pv_benefits / total_capex,
     )
+    shape = np.broadcast_shapes(*(np.shape(value) for value in terms.values()))
+    return {name: np.broadcast_to(value, shape).astype(np.float64) for name, value in terms.items()}
+
+
+def calculate_irr_vec(
+    electricity_price_gbp_mwh: np.ndarray = ELECTRICITY_PRICE_GBP_MWH,
+    carbon_price_gbp_tonne:    np.ndarray = CARBON_PRICE_BASELINE,
+    project_life_yr:           int = PROJECT_LIFE_YR,
+    diesel_price_gbp_litre:    np.ndarray = DIESEL_PRICE_GBP_LITRE,
+) -> np.ndarray:
+    """
+    IRR (%) over broadcast price grids; NaN where no IRR exists in [-50%, +200%].
+
+    Every grid point has the level-annuity profile [-CAPEX, B, ..., B], so the
+    whole grid is solved at once by _annuity_irr_vec — the same iteration
+    calculate_npv_irr uses, giving the same IRRs.
+    """
+    annual_benefit = calculate_annual_costs_vec(
+        electricity_price_gbp_mwh, carbon_price_gbp_tonne, diesel_price_gbp_litre
+    )["total_annual_benefit_gbp"]
+    return _annuity_irr_vec(_DEFAULT_CAPEX.total_capex_gbp, annual_benefit, project_life_yr) * 100
+
 
+def _breakeven_terms(h2_price_gbp_kg, diesel_co2_tonnes, carbon_price_gbp_tonne):
+    """Breakeven diesel price (£/litre); every argument may be a NumPy array."""
+    h2_annual = DEFAULT_DEMAND.annual_total_kg * h2_price_gbp_kg
+    # Carbon penalty on diesel
+    diesel_carbon_penalty = (diesel_co2_tonnes * carbon_price_gbp_tonne)
+    total_diesel_litres = ANNUAL_DIESEL_LITRES
+
+    # (total_litres × price + carbon_penalty) = h2_annual
+    return (h2_annual - diesel_carbon_penalty) / total_diesel_litres
 
+
+@lru_cache(maxsize=4096)
 def diesel_breakeven_price(
     electricity_price_gbp_mwh: float,
     carbon_price_gbp_tonne: float = 0.0,
@@ -279,15 +690,19 @@ def diesel_breakeven_price(
 
     diesel_cost = h2_cost  →  solve for diesel_price_per_litre
     """
-    demand = calculate_demand()
-    lcoh   = calculate_lcoh(electricity_price_gbp_mwh)
-    emis   = calculate_emissions(electricity_price_gbp_mwh)
+    lcoh = calculate_lcoh(electricity_price_gbp_mwh)
+    emis = calculate_emissions(electricity_price_gbp_mwh)
+    return _breakeven_terms(
+        lcoh.total_dispensed_cost_gbp_kg, emis.diesel_annual_co2_tonnes, carbon_price_gbp_tonne
+    )
 
-    h2_annual = demand.annual_total_kg * lcoh.total_dispensed_cost_gbp_kg
-    # Carbon penalty on diesel
-    diesel_carbon_penalty = (emis.diesel_annual_co2_tonnes * carbon_price_gbp_tonne)
-    total_diesel_litres = (TOTAL_BUSES * DAILY_MILEAGE_KM * DAYS_PER_YEAR) / DIESEL_FUEL_ECONOMY_KM_L
 
-    # (total_litres × price + carbon_penalty) = h2_annual
-    breakeven = (h2_annual - diesel_carbon_penalty) / total_diesel_litres
-    return round(breakeven, 3)
+def diesel_breakeven_price_vec(
+    electricity_price_gbp_mwh: np.ndarray,
+    carbon_price_gbp_tonne: np.ndarray = 0.0,
+) -> np.ndarray:
+    """Vectorised diesel_breakeven_price; the two prices broadcast against each other."""
+    lcoh_total = calculate_lcoh_vec(electricity_price_gbp_mwh)["total_dispensed_cost_gbp_kg"]
+    diesel_co2 = calculate_emissions_vec(electricity_price_gbp_mwh)["diesel_annual_co2_tonnes"]
+    breakeven = _breakeven_terms(lcoh_total, diesel_co2, carbon_price_gbp_tonne)
+    return np.asarray(breakeven, dtype=np.float64)
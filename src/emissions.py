@@ -7,16 +7,20 @@ Well-to-Wheel (WtW) CO2 equivalent emission calculations for:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+
 from src.parameters import (
     GRID_CARBON_INTENSITY_G_KWH, ELECTROLYSER_EFFICIENCY_KWH_KG,
     HRS_ENERGY_KWH_KG, TRANSPORT_EMISSION_KG_KG,
     DIESEL_EMISSION_KG_KM,
     TOTAL_BUSES, DAILY_MILEAGE_KM, DAYS_PER_YEAR,
 )
-from src.demand import calculate_demand
+from src.demand import DEFAULT_DEMAND, DemandResults
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmissionsResults:
     # H2 pathway emission factors (kg CO2e per kg H2)
     production_co2_kg_kgh2:   float
@@ -31,8 +35,37 @@ class EmissionsResults:
     co2_reduction_pct:        float
 
 
+def _emissions_terms(grid_carbon_intensity, demand: DemandResults = DEFAULT_DEMAND) -> dict:
+    """Emission results keyed by EmissionsResults field; broadcasts over the grid intensity."""
+
+    # H2 emission factors
+    prod_ef   = (ELECTROLYSER_EFFICIENCY_KWH_KG * grid_carbon_intensity) / 1_000   # kg CO2e/kg H2
+    hrs_ef    = (HRS_ENERGY_KWH_KG * grid_carbon_intensity) / 1_000                # kg CO2e/kg H2
+    trans_ef  = TRANSPORT_EMISSION_KG_KG                                            # kg CO2e/kg H2
+    total_ef  = prod_ef + hrs_ef + trans_ef
+
+    # Annual totals
+    h2_annual_co2  = (demand.annual_total_kg * total_ef) / 1_000                   # tonnes
+    diesel_annual_co2 = (demand.annual_fleet_mileage_km * DIESEL_EMISSION_KG_KM) / 1_000  # tonnes
+    saving = diesel_annual_co2 - h2_annual_co2
+    reduction_pct = (saving / diesel_annual_co2) * 100
+
+    return dict(
+        production_co2_kg_kgh2=prod_ef,
+        hrs_co2_kg_kgh2=hrs_ef,
+        transport_co2_kg_kgh2=trans_ef,
+        total_h2_ef_kg_kgh2=total_ef,
+        h2_annual_co2_tonnes=h2_annual_co2,
+        diesel_annual_co2_tonnes=diesel_annual_co2,
+        co2_saving_tonnes_yr=saving,
+        co2_reduction_pct=reduction_pct,
+    )
+
+
+@lru_cache(maxsize=256)
 def calculate_emissions(
     grid_carbon_intensity: float = GRID_CARBON_INTENSITY_G_KWH,
+    demand: Optional[DemandResults] = None,
 ) -> EmissionsResults:
     """
     Calculate WtW CO2e emissions for both pathways.
@@ -46,28 +79,21 @@ def calculate_emissions(
     Diesel pathway
     --------------
     Emission factor per km × annual fleet mileage
+
+    Annual totals are for the baseline fleet unless another `demand` is given.
     """
-    demand = calculate_demand()
+    if demand is None:
+        demand = DEFAULT_DEMAND
+    return EmissionsResults(**_emissions_terms(grid_carbon_intensity, demand))
 
-    # H2 emission factors
-    prod_ef   = (ELECTROLYSER_EFFICIENCY_KWH_KG * grid_carbon_intensity) / 1_000   # kg CO2e/kg H2
-    hrs_ef    = (HRS_ENERGY_KWH_KG * grid_carbon_intensity) / 1_000                # kg CO2e/kg H2
-    trans_ef  = TRANSPORT_EMISSION_KG_KG                                            # kg CO2e/kg H2
-    total_ef  = prod_ef + hrs_ef + trans_ef
 
-    # Annual totals
-    h2_annual_co2  = (demand.annual_total_kg * total_ef) / 1_000                   # tonnes
-    diesel_annual_co2 = (demand.annual_fleet_mileage_km * DIESEL_EMISSION_KG_KM) / 1_000  # tonnes
-    saving = diesel_annual_co2 - h2_annual_co2
-    reduction_pct = (saving / diesel_annual_co2) * 100
+def calculate_emissions_vec(grid_carbon_intensity: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Vectorised calculate_emissions over an array of grid carbon intensities.
 
-    return EmissionsResults(
-        production_co2_kg_kgh2=round(prod_ef, 4),
-        hrs_co2_kg_kgh2=round(hrs_ef, 4),
-        transport_co2_kg_kgh2=round(trans_ef, 4),
-        total_h2_ef_kg_kgh2=round(total_ef, 4),
-        h2_annual_co2_tonnes=round(h2_annual_co2, 1),
-        diesel_annual_co2_tonnes=round(diesel_annual_co2, 1),
-        co2_saving_tonnes_yr=round(saving, 1),
-        co2_reduction_pct=round(reduction_pct, 1),
-    )
+    Returns a dict keyed by the EmissionsResults field names, each value an
+    array shaped like `grid_carbon_intensity`.
+    """
+    intensity = np.asarray(grid_carbon_intensity, dtype=np.float64)
+    terms = _emissions_terms(intensity)
+    return {name: np.broadcast_to(value, intensity.shape).copy() for name, value in terms.items()}
@@ -7,6 +7,7 @@ CAPEX and capacity calculations for:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from src.parameters import (
     NEW_ELECTROLYSER_MWE, ELECTROLYSER_COST_PER_KW,
     BOP_FRACTION, EUR_GBP, HRS_CAPEX_EUR_PER_STATION,
@@ -16,7 +17,7 @@ from src.parameters import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InfrastructureCapex:
     # Electrolyser
     electrolyser_equipment_gbp:   float
@@ -33,6 +34,45 @@ class InfrastructureCapex:
     total_network_dispensing_kg_day: float
 
 
+def _capex_terms(
+    new_electrolyser_mwe=NEW_ELECTROLYSER_MWE,
+    electrolyser_cost_per_kw=ELECTROLYSER_COST_PER_KW,
+    bop_fraction=BOP_FRACTION,
+    hrs_capex_eur=HRS_CAPEX_EUR_PER_STATION,
+    n_new_stations=NEW_HRS_STATIONS,
+    eur_gbp=EUR_GBP,
+) -> dict:
+    """CAPEX results keyed by InfrastructureCapex field; broadcasts over NumPy array inputs."""
+    # Electrolyser
+    capacity_kw = new_electrolyser_mwe * 1_000
+    equip = capacity_kw * electrolyser_cost_per_kw
+    bop   = equip * bop_fraction
+    elec_total = equip + bop
+
+    # HRS
+    hrs_per_station_gbp = hrs_capex_eur / eur_gbp
+    hrs_total = hrs_per_station_gbp * n_new_stations
+
+    total_capex = elec_total + hrs_total
+
+    # Production capacities
+    new_prod = new_electrolyser_mwe * ELECTROLYSER_YIELD
+    total_prod = EXISTING_TYSELEY_CAPACITY_KG_DAY + new_prod
+
+    return dict(
+        electrolyser_equipment_gbp=equip,
+        electrolyser_bop_gbp=bop,
+        electrolyser_total_gbp=elec_total,
+        hrs_per_station_gbp=hrs_per_station_gbp,
+        hrs_total_gbp=hrs_total,
+        total_capex_gbp=total_capex,
+        new_production_kg_day=new_prod,
+        total_production_kg_day=total_prod,
+        total_network_dispensing_kg_day=TOTAL_NETWORK_CAPACITY,
+    )
+
+
+@lru_cache(maxsize=256)
 def calculate_capex(
     new_electrolyser_mwe: float = NEW_ELECTROLYSER_MWE,
     electrolyser_cost_per_kw: float = ELECTROLYSER_COST_PER_KW,
@@ -55,30 +95,7 @@ def calculate_capex(
     Per-station cost from Thomas et al. (2019) in EUR, converted to GBP.
     Total = per_station * n_stations
     """
-    # Electrolyser
-    capacity_kw = new_electrolyser_mwe * 1_000
-    equip = capacity_kw * electrolyser_cost_per_kw
-    bop   = equip * bop_fraction
-    elec_total = equip + bop
-
-    # HRS
-    hrs_per_station_gbp = hrs_capex_eur / eur_gbp
-    hrs_total = hrs_per_station_gbp * n_new_stations
-
-    total_capex = elec_total + hrs_total
-
-    # Production capacities
-    new_prod = new_electrolyser_mwe * ELECTROLYSER_YIELD
-    total_prod = EXISTING_TYSELEY_CAPACITY_KG_DAY + new_prod
-
-    return InfrastructureCapex(
-        electrolyser_equipment_gbp=round(equip, 0),
-        electrolyser_bop_gbp=round(bop, 0),
-        electrolyser_total_gbp=round(elec_total, 0),
-        hrs_per_station_gbp=round(hrs_per_station_gbp, 0),
-        hrs_total_gbp=round(hrs_total, 0),
-        total_capex_gbp=round(total_capex, 0),
-        new_production_kg_day=round(new_prod, 0),
-        total_production_kg_day=round(total_prod, 0),
-        total_network_dispensing_kg_day=TOTAL_NETWORK_CAPACITY,
-    )
+    return InfrastructureCapex(**_capex_terms(
+        new_electrolyser_mwe, electrolyser_cost_per_kw, bop_fraction,
+        hrs_capex_eur, n_new_stations, eur_gbp,
+    ))
@@ -6,8 +6,16 @@ All baseline constants derived from the coursework report:
   - Inigo Antony Michael Selvam, MSc Sustainable Energy Systems, University of Birmingham
 
 Units are SI where possible; explicit unit comments are given for every value.
+
+The module is read-only once imported: assigning to any of its names raises
+AttributeError. PARAMS gives the same constants as a read-only mapping.
 """
 
+import sys
+from types import MappingProxyType, ModuleType
+
+import numpy as np
+
 # ──────────────────────────────────────────────
 # FLEET
 # ──────────────────────────────────────────────
@@ -105,3 +113,50 @@ DIESEL_TANK_LITRES          = 245     # litres
 CARBON_PRICE_BASELINE       = 50      # £/tonne CO2e
 CARBON_PRICE_MIN            = 20
 CARBON_PRICE_MAX            = 200
+
+# ──────────────────────────────────────────────
+# DERIVED QUANTITIES  (fixed at import, shared by economics)
+# ──────────────────────────────────────────────
+ANNUAL_FLEET_KM             = TOTAL_BUSES * DAILY_MILEAGE_KM * DAYS_PER_YEAR           # km/yr
+ANNUAL_DIESEL_LITRES        = ANNUAL_FLEET_KM / DIESEL_FUEL_ECONOMY_KM_L               # litres/yr
+ANNUAL_NEW_PRODUCTION_KG    = NEW_ELECTROLYSER_MWE * ELECTROLYSER_YIELD * DAYS_PER_YEAR  # kg/yr
+
+# ──────────────────────────────────────────────
+# LCOH PARAMETER VECTOR
+# ──────────────────────────────────────────────
+# Order matches the override arguments of economics.calculate_lcoh_vec, so a
+# whole scenario (or a (5, n) stack of scenarios) can be swapped in at once.
+LCOH_PARAMS = np.array([
+    ELECTROLYSER_EFFICIENCY_KWH_KG,   # kWh/kg
+    ELECTROLYSER_COST_PER_KW,         # £/kW
+    BOP_FRACTION,                     # –
+    TRANSPORT_COST_GBP_KG,            # £/kg
+    HRS_OPEX_GBP_KG,                  # £/kg
+], dtype=np.float64)
+LCOH_PARAMS.flags.writeable = False
+
+# ──────────────────────────────────────────────
+# READ-ONLY ACCESS
+# ──────────────────────────────────────────────
+# Results downstream are memoised and figures render in worker processes, so
+# rebinding a constant at runtime would silently serve stale values.
+PARAMS = MappingProxyType({name: value for name, value in globals().items() if name.isupper()})
+
+# Star imports get the constants only, not the helper imports above
+__all__ = [*PARAMS, "PARAMS"]
+
+
+class _FrozenModule(ModuleType):
+    # Dunder attributes stay writable for the import machinery (e.g. reload)
+    def __setattr__(self, name, value):
+        if not name.startswith("__"):
+            raise AttributeError(f"{self.__name__} is read-only; cannot set {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if not name.startswith("__"):
+            raise AttributeError(f"{self.__name__} is read-only; cannot delete {name!r}")
+        super().__delattr__(name)
+
+
+sys.modules[__name__].__class__ = _FrozenModule
@@ -5,7 +5,7 @@ Generates all sensitivity analyses and saves publication-quality matplotlib figu
 
 Figures produced
 ----------------
-1.  lcoh_vs_electricity.png     – LCOH components stacked bar + total line vs electricity price
+1.  lcoh_vs_electricity.png     – LCOH components stacked area + total line vs electricity price
 2.  annual_cost_vs_elec.png     – H2 vs diesel annual fleet fuel cost vs electricity price
 3.  breakeven_diesel.png        – Breakeven diesel price vs electricity price (multiple carbon prices)
 4.  npv_vs_elec_carbon.png      – NPV vs electricity price for multiple carbon price scenarios
@@ -16,11 +16,20 @@ Figures produced
 9.  lcoh_sensitivity_tornado.png– Tornado chart: one-at-a-time parameter sensitivity on LCOH
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Optional
+
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.ticker as mticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.colors import TwoSlopeNorm
+from matplotlib.patches import Patch
 
 from src.parameters import (
     ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH,
@@ -32,12 +41,20 @@ from src.parameters import (
     BOP_FRACTION,
 )
 from src.economics import (
-    calculate_lcoh, calculate_annual_costs, calculate_npv_irr, diesel_breakeven_price
+    calculate_lcoh, calculate_lcoh_vec, calculate_annual_costs_vec,
+    calculate_npv_vec, calculate_irr_vec, diesel_breakeven_price_vec,
 )
 from src.infrastructure import calculate_capex
 from src.emissions import calculate_emissions
 
 OUTPUT_DIR = "outputs"
+SAVE_WEBP  = False     # also write a .webp copy of every figure
+# zlib level for the PNGs: 1 encodes the nine figures ~40% faster than PIL's
+# default of 6 for ~20% larger files; raise it when file size matters more
+PNG_COMPRESS_LEVEL = 1
+
+# Grid points are rounded so repeated prices hit the economics lru_caches exactly
+GRID_DECIMALS = 6
 
 # ── style ──────────────────────────────────────────────────────────────────────
 
@@ -52,55 +69,147 @@ PALETTE = {
     "light_orange": "#FAD7A0",
 }
 
+# Line colours for the carbon-price scenario sweeps (Figures 3, 4 and 5)
+_CARBON_COLOURS_4 = (PALETTE["blue"], PALETTE["green"], PALETTE["orange"], PALETTE["red"])
+_CARBON_COLOURS_5 = (PALETTE["grey"],) + _CARBON_COLOURS_4
+_IRR_COLOURS      = (PALETTE["grey"], PALETTE["blue"], PALETTE["orange"], PALETTE["red"])
+
+_STYLE = {
+    "figure.dpi":        150,
+    "figure.facecolor":  "white",
+    "axes.facecolor":    "#F8F9FA",
+    "axes.grid":         True,
+    "axes.grid.which":   "major",
+    "grid.color":        "#DDDDDD",
+    "grid.linewidth":    0.7,
+    "axes.spines.top":   False,
+    "axes.spines.right": False,
+    "font.family":       "sans-serif",
+    "font.size":         11,
+    "axes.labelsize":    12,
+    "axes.titlesize":    13,
+    "axes.titleweight":  "bold",
+    "legend.frameon":    True,
+    "legend.framealpha": 0.9,
+}
+
 def _set_style():
-    plt.rcParams.update({
-        "figure.dpi":        150,
-        "figure.facecolor":  "white",
-        "axes.facecolor":    "#F8F9FA",
-        "axes.grid":         True,
-        "axes.grid.which":   "major",
-        "grid.color":        "#DDDDDD",
-        "grid.linewidth":    0.7,
-        "axes.spines.top":   False,
-        "axes.spines.right": False,
-        "font.family":       "sans-serif",
-        "font.size":         11,
-        "axes.labelsize":    12,
-        "axes.titlesize":    13,
-        "axes.titleweight":  "bold",
-        "legend.frameon":    True,
-        "legend.framealpha": 0.9,
-    })
-
-def _savefig(fig, name: str):
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    path = os.path.join(OUTPUT_DIR, name)
-    fig.savefig(path, bbox_inches="tight")
-    plt.close(fig)
+    # rcParams validates every key on update, so apply the style once per process
+    if getattr(_set_style, "_done", False):
+        return
+    matplotlib.rcParams.update(_STYLE)
+    _set_style._done = True
+
+def _figure(**kwargs) -> Figure:
+    # A bare Figure on an Agg canvas: pyplot's figure manager (and its GUI
+    # event-loop hooks) never sees it, so nothing is left to close afterwards
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+def _subplots(fig, figsize, *grid, layout: Optional[str] = "constrained"):
+    """
+    Axes for a plot: on a new figure if `fig` is None, otherwise on `fig`
+    after clearing and resizing it (reusing one figure across a batch).
+    Layout is constrained by default; pass layout=None to place axes by hand.
+    """
+    if fig is None:
+        fig = _figure(figsize=figsize, layout=layout)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+        fig.set_layout_engine(layout)
+    return fig, fig.subplots(*grid)
+
+def _output_dir() -> str:
+    # makedirs stats the path on every call; create it once per process
+    # (again only if OUTPUT_DIR is repointed) so standalone plot_* calls still work
+    if getattr(_output_dir, "_made", None) != OUTPUT_DIR:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _output_dir._made = OUTPUT_DIR
+    return OUTPUT_DIR
+
+def _savefig(fig, name: str, tight: bool = False):
+    """
+    Render once and write the PNG straight from the Agg canvas. tight=True opts
+    back into savefig's bbox_inches="tight" crop (an extra layout pass).
+    """
+    path = f"{_output_dir()}/{name}"
+    pil_kwargs = {"compress_level": PNG_COMPRESS_LEVEL}
+    if tight:
+        fig.savefig(path, bbox_inches="tight", pil_kwargs=pil_kwargs)
+    else:
+        fig.canvas.print_png(path, pil_kwargs=pil_kwargs)
+    if SAVE_WEBP:
+        from PIL import Image  # only needed for the optional WebP copies
+
+        # Re-encode the pixels just rendered rather than drawing again
+        Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(
+            os.path.splitext(path)[0] + ".webp", "WEBP", quality=92)
     print(f"  ✓ Saved {path}")
 
+def _label_bars(ax, bars, values, fmt: str, padding: float, horizontal: bool = False, **kwargs):
+    """
+    Label each bar's end with fmt % value, offset by `padding` points, the way
+    bar_label does but from the known values rather than the bar artists.
+    """
+    for bar, value in zip(bars, values):
+        if horizontal:
+            xy = (bar.get_x() + bar.get_width(), bar.get_y() + bar.get_height() / 2)
+            offset, align = (padding, 0), dict(ha="left", va="center")
+        else:
+            xy = (bar.get_x() + bar.get_width() / 2, bar.get_y() + bar.get_height())
+            offset, align = (0, padding), dict(ha="center", va="bottom")
+        ax.annotate(fmt % value, xy, xytext=offset, textcoords="offset points",
+                    **align, **kwargs)
+
+def _grid(lo: float, hi: float, n: int) -> np.ndarray:
+    grid = np.round(np.linspace(lo, hi, n), GRID_DECIMALS)
+    grid.flags.writeable = False  # shared between figures
+    return grid
+
+
+# Shared across figures: the default price sweeps and the baseline results.
+# Curves that are affine in electricity price (LCOH layers, annual cost,
+# breakeven, NPV) are drawn exactly from a coarse grid; finer sampling is kept
+# for the nonlinear IRR curve.
+ELEC_GRID          = _grid(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 80)
+LINEAR_ELEC_GRID   = _grid(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 21)
+# Carbon-price scenarios, and the same prices as a read-only column that
+# broadcasts against an electricity-price row into a (carbon, electricity) grid
+CARBON_SCENARIOS   = (0, 50, 100, 150, 200)
+CARBON_COLUMN      = np.array(CARBON_SCENARIOS, dtype=np.float64)[:, None]
+CARBON_COLUMN.flags.writeable = False
+BASELINE_LCOH      = calculate_lcoh()
+BASELINE_CAPEX     = calculate_capex()
+BASELINE_EMISSIONS = calculate_emissions()
+
+def _plot_scenarios(ax, x, grid, scenarios, colours, label: str):
+    """
+    Draw one line per row of a (carbon, electricity) grid in a single ax.plot
+    call, then colour and label each line by its carbon price in `scenarios`.
+    """
+    lines = ax.plot(x, grid.T, lw=2.2)
+    for line, colour, cp in zip(lines, colours, scenarios, strict=True):
+        line.set_color(colour)
+        line.set_label(label.format(cp=cp))
+
 
 # ── Figure 1: LCOH vs Electricity Price ───────────────────────────────────────
 
-def plot_lcoh_vs_electricity(elec_range=None):
+def plot_lcoh_vs_electricity(elec_range=None, fig=None):
     if elec_range is None:
-        elec_range = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 80)
+        elec_range = LINEAR_ELEC_GRID
 
-    elec_costs, capex_costs, opex_costs, stack_costs, trans_costs, hrs_costs, totals = (
-        [], [], [], [], [], [], []
-    )
-    for ep in elec_range:
-        lc = calculate_lcoh(ep)
-        elec_costs.append(lc.electricity_cost_gbp_kg)
-        capex_costs.append(lc.capex_amortised_gbp_kg)
-        opex_costs.append(lc.opex_non_energy_gbp_kg)
-        stack_costs.append(lc.stack_replacement_gbp_kg)
-        trans_costs.append(lc.transport_gbp_kg)
-        hrs_costs.append(lc.hrs_opex_gbp_kg)
-        totals.append(lc.total_dispensed_cost_gbp_kg)
-
-    fig, ax = plt.subplots(figsize=(9, 5.5))
-    bottom = np.zeros(len(elec_range))
+    lc = calculate_lcoh_vec(elec_range)
+    elec_costs  = lc["electricity_cost_gbp_kg"]
+    capex_costs = lc["capex_amortised_gbp_kg"]
+    opex_costs  = lc["opex_non_energy_gbp_kg"]
+    stack_costs = lc["stack_replacement_gbp_kg"]
+    trans_costs = lc["transport_gbp_kg"]
+    hrs_costs   = lc["hrs_opex_gbp_kg"]
+
+    fig, ax = _subplots(fig, (9, 5.5))
     layers = [
         ("Electricity",       elec_costs,  PALETTE["blue"]),
         ("CAPEX (amort.)",    capex_costs, PALETTE["orange"]),
@@ -109,15 +218,18 @@ def plot_lcoh_vs_electricity(elec_range=None):
         ("Transport",         trans_costs, PALETTE["grey"]),
         ("HRS operations",    hrs_costs,   PALETTE["red"]),
     ]
-    for label, values, colour in layers:
-        ax.bar(elec_range, values, bottom=bottom, width=1.1,
-               label=label, color=colour, alpha=0.85, linewidth=0)
-        bottom += np.array(values)
+    # (6, n) layer stack drawn as six filled polygons; column sums give the total
+    stack = np.vstack([values for _, values, _ in layers])
+    totals = stack.sum(axis=0)
+    ax.stackplot(elec_range, stack,
+                 labels=[label for label, _, _ in layers],
+                 colors=[colour for _, _, colour in layers],
+                 alpha=0.85, linewidth=0)
 
     ax.plot(elec_range, totals, color="black", lw=2.0, zorder=5, label="Total LCOH")
 
     # Mark baseline
-    baseline_lcoh = calculate_lcoh(ELECTRICITY_PRICE_GBP_MWH)
+    baseline_lcoh = BASELINE_LCOH
     ax.axvline(ELECTRICITY_PRICE_GBP_MWH, color="black", ls="--", lw=1.2, alpha=0.6)
     ax.annotate(f"Baseline\n£{ELECTRICITY_PRICE_GBP_MWH}/MWh",
                 xy=(ELECTRICITY_PRICE_GBP_MWH, baseline_lcoh.total_dispensed_cost_gbp_kg + 0.3),
@@ -128,36 +240,33 @@ def plot_lcoh_vs_electricity(elec_range=None):
     ax.set_title("Levelised Cost of Hydrogen at Dispenser vs. Electricity Price")
     ax.legend(loc="upper left", fontsize=9)
     ax.set_xlim(elec_range[0], elec_range[-1])
-    ax.set_ylim(0, max(totals) * 1.12)
-    fig.tight_layout()
+    ax.set_ylim(0, totals.max() * 1.12)
     _savefig(fig, "lcoh_vs_electricity.png")
 
 
 # ── Figure 2: Annual Fleet Fuel Cost ──────────────────────────────────────────
 
-def plot_annual_cost_vs_electricity(elec_range=None):
+def plot_annual_cost_vs_electricity(elec_range=None, fig=None):
     if elec_range is None:
-        elec_range = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 80)
+        elec_range = LINEAR_ELEC_GRID
 
-    h2_costs, diesel_costs = [], []
-    for ep in elec_range:
-        ac = calculate_annual_costs(ep)
-        h2_costs.append(ac.h2_fuel_cost_gbp / 1e6)
-        diesel_costs.append(ac.diesel_fuel_cost_gbp / 1e6)
+    ac = calculate_annual_costs_vec(elec_range)
+    h2_costs     = ac["h2_fuel_cost_gbp"] / 1e6
+    diesel_costs = ac["diesel_fuel_cost_gbp"] / 1e6
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
+    fig, ax = _subplots(fig, (9, 5.5))
     ax.plot(elec_range, h2_costs, color=PALETTE["blue"], lw=2.5, label="H₂ fleet (total fuel cost)")
     ax.axhline(diesel_costs[0], color=PALETTE["orange"], lw=2.5, ls="--",
                label=f"Diesel fleet (£{DIESEL_PRICE_GBP_LITRE}/L baseline)")
 
     # Fill region
-    h2_arr = np.array(h2_costs)
+    h2_arr = h2_costs
     d_val = diesel_costs[0]
     ax.fill_between(elec_range, h2_arr, d_val,
-                    where=(h2_arr < d_val), alpha=0.15, color=PALETTE["green"],
+                    where=(h2_arr < d_val), interpolate=True, alpha=0.15, color=PALETTE["green"],
                     label="H₂ cheaper")
     ax.fill_between(elec_range, h2_arr, d_val,
-                    where=(h2_arr >= d_val), alpha=0.15, color=PALETTE["red"],
+                    where=(h2_arr >= d_val), interpolate=True, alpha=0.15, color=PALETTE["red"],
                     label="Diesel cheaper")
 
     ax.axvline(ELECTRICITY_PRICE_GBP_MWH, color="grey", ls=":", lw=1.3)
@@ -167,25 +276,23 @@ def plot_annual_cost_vs_electricity(elec_range=None):
     ax.legend(fontsize=9)
     ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("£%.1fM"))
     ax.set_xlim(elec_range[0], elec_range[-1])
-    fig.tight_layout()
     _savefig(fig, "annual_cost_vs_elec.png")
 
 
 # ── Figure 3: Breakeven Diesel Price ──────────────────────────────────────────
 
-def plot_breakeven_diesel(elec_range=None):
+def plot_breakeven_diesel(elec_range=None, fig=None):
     if elec_range is None:
-        elec_range = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 100)
-
-    carbon_scenarios = [0, 50, 100, 150]
+        elec_range = LINEAR_ELEC_GRID
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
-    colours = [PALETTE["blue"], PALETTE["green"], PALETTE["orange"], PALETTE["red"]]
+    fig, ax = _subplots(fig, (9, 5.5))
+    colours = _CARBON_COLOURS_4
+    n = len(colours)
 
-    for cp, col in zip(carbon_scenarios, colours):
-        breakevens = [diesel_breakeven_price(ep, cp) for ep in elec_range]
-        ax.plot(elec_range, breakevens, lw=2.2, color=col,
-                label=f"Carbon price = £{cp}/t CO₂e")
+    # One row of breakeven prices per carbon scenario (first four)
+    breakeven_grid = diesel_breakeven_price_vec(elec_range[None, :], CARBON_COLUMN[:n])
+    _plot_scenarios(ax, elec_range, breakeven_grid, CARBON_SCENARIOS[:n], colours,
+                    "Carbon price = £{cp}/t CO₂e")
 
     # Reference lines
     ax.axhline(DIESEL_PRICE_GBP_LITRE, color="black", ls="--", lw=1.5, alpha=0.7,
@@ -200,31 +307,26 @@ def plot_breakeven_diesel(elec_range=None):
     ax.legend(fontsize=9)
     ax.set_xlim(elec_range[0], elec_range[-1])
     ax.set_ylim(bottom=0)
-    fig.tight_layout()
     _savefig(fig, "breakeven_diesel.png")
 
 
 # ── Figure 4: NPV vs Electricity Price ────────────────────────────────────────
 
-def plot_npv_vs_electricity(elec_range=None):
+def plot_npv_vs_electricity(elec_range=None, fig=None):
     if elec_range is None:
-        elec_range = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 80)
+        elec_range = LINEAR_ELEC_GRID
 
-    carbon_scenarios = [0, 50, 100, 150, 200]
-    colours = [PALETTE["grey"], PALETTE["blue"], PALETTE["green"],
-               PALETTE["orange"], PALETTE["red"]]
+    colours = _CARBON_COLOURS_5
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
-    for cp, col in zip(carbon_scenarios, colours):
-        npvs = [calculate_npv_irr(ep, cp).npv_gbp / 1e6 for ep in elec_range]
-        ax.plot(elec_range, npvs, lw=2.2, color=col,
-                label=f"Carbon = £{cp}/t CO₂e")
+    fig, ax = _subplots(fig, (9, 5.5))
+    # One row of NPVs (£M) per carbon scenario
+    npv_grid = calculate_npv_vec(elec_range[None, :], CARBON_COLUMN)["npv_gbp"] / 1e6
+    npv_by_cp = dict(zip(CARBON_SCENARIOS, npv_grid))
+    _plot_scenarios(ax, elec_range, npv_grid, CARBON_SCENARIOS, colours, "Carbon = £{cp}/t CO₂e")
 
     ax.axhline(0, color="black", lw=1.5, ls="-")
     ax.axvline(ELECTRICITY_PRICE_GBP_MWH, color="grey", ls=":", lw=1.3)
-    ax.fill_between(elec_range,
-                    [calculate_npv_irr(ep, CARBON_PRICE_BASELINE).npv_gbp / 1e6
-                     for ep in elec_range],
+    ax.fill_between(elec_range, npv_by_cp[CARBON_PRICE_BASELINE],
                     0, alpha=0.06, color=PALETTE["blue"])
 
     ax.set_xlabel("Electricity Price  (£/MWh)")
@@ -233,27 +335,24 @@ def plot_npv_vs_electricity(elec_range=None):
     ax.legend(fontsize=9, title="Carbon price")
     ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("£%.0fM"))
     ax.set_xlim(elec_range[0], elec_range[-1])
-    fig.tight_layout()
     _savefig(fig, "npv_vs_elec_carbon.png")
 
 
 # ── Figure 5: IRR vs Electricity Price ────────────────────────────────────────
 
-def plot_irr_vs_electricity(elec_range=None):
+def plot_irr_vs_electricity(elec_range=None, fig=None):
     if elec_range is None:
-        elec_range = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 80)
+        elec_range = ELEC_GRID
 
-    carbon_scenarios = [0, 50, 100, 150]
-    colours = [PALETTE["grey"], PALETTE["blue"], PALETTE["orange"], PALETTE["red"]]
+    colours = _IRR_COLOURS
+    n = len(colours)
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
-    for cp, col in zip(carbon_scenarios, colours):
-        irrs = []
-        for ep in elec_range:
-            res = calculate_npv_irr(ep, cp)
-            irrs.append(res.irr_pct if res.irr_pct is not None else np.nan)
-        ax.plot(elec_range, irrs, lw=2.2, color=col,
-                label=f"Carbon = £{cp}/t CO₂e")
+    # One row of IRRs (%) per carbon scenario (first four); NaN where no IRR exists
+    irr_grid = calculate_irr_vec(elec_range[None, :], CARBON_COLUMN[:n])
+
+    fig, ax = _subplots(fig, (9, 5.5))
+    _plot_scenarios(ax, elec_range, irr_grid, CARBON_SCENARIOS[:n], colours,
+                    "Carbon = £{cp}/t CO₂e")
 
     ax.axhline(DISCOUNT_RATE * 100, color="black", ls="--", lw=1.5,
                label=f"WACC = {DISCOUNT_RATE*100:.0f}% (hurdle rate)")
@@ -265,25 +364,26 @@ def plot_irr_vs_electricity(elec_range=None):
     ax.set_title("Internal Rate of Return vs. Electricity Price")
     ax.legend(fontsize=9)
     ax.set_xlim(elec_range[0], elec_range[-1])
-    fig.tight_layout()
     _savefig(fig, "irr_vs_elec.png")
 
 
 # ── Figure 6: NPV Heatmap ─────────────────────────────────────────────────────
 
-def plot_npv_heatmap():
-    elec_range   = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 50)
-    carbon_range = np.linspace(CARBON_PRICE_MIN, CARBON_PRICE_MAX, 50)
+def plot_npv_heatmap(fig=None):
+    # NPV is bilinear in (electricity, carbon); Gouraud shading interpolates between nodes
+    elec_range   = _grid(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 26)
+    carbon_range = _grid(CARBON_PRICE_MIN, CARBON_PRICE_MAX, 26)
 
-    Z = np.zeros((len(carbon_range), len(elec_range)))
-    for i, cp in enumerate(carbon_range):
-        for j, ep in enumerate(elec_range):
-            Z[i, j] = calculate_npv_irr(ep, cp).npv_gbp / 1e6
+    # Rows follow carbon price, columns electricity price
+    Z = calculate_npv_vec(elec_range[None, :], carbon_range[:, None])["npv_gbp"] / 1e6
 
-    fig, ax = plt.subplots(figsize=(9, 6))
+    fig, ax = _subplots(fig, (9, 6), layout=None)
     norm = TwoSlopeNorm(vmin=Z.min(), vcenter=0, vmax=Z.max())
-    im = ax.contourf(elec_range, carbon_range, Z, levels=25, cmap="RdYlGn", norm=norm)
-    ax.contour(elec_range, carbon_range, Z, levels=[0], colors="black", linewidths=2.0)
+    # Mesh and breakeven line are rasterised; axes and text stay vector
+    im = ax.pcolormesh(elec_range, carbon_range, Z, cmap="RdYlGn", norm=norm,
+                       shading="gouraud", rasterized=True)
+    ax.contour(elec_range, carbon_range, Z, levels=[0], colors="black", linewidths=2.0,
+               rasterized=True)
     cbar = fig.colorbar(im, ax=ax, label="NPV  (£M)")
 
     ax.scatter([ELECTRICITY_PRICE_GBP_MWH], [CARBON_PRICE_BASELINE],
@@ -294,16 +394,16 @@ def plot_npv_heatmap():
     ax.set_ylabel("Carbon Price  (£/t CO₂e)")
     ax.set_title("NPV Heatmap: Electricity Price × Carbon Price\n(Black contour = NPV breakeven)")
     ax.legend(loc="lower right", fontsize=9)
-    fig.tight_layout()
+    fig.subplots_adjust(left=0.1, right=0.95, top=0.88, bottom=0.1)
     _savefig(fig, "npv_heatmap.png")
 
 
 # ── Figure 7: Emissions Comparison ────────────────────────────────────────────
 
-def plot_emissions_comparison():
-    emis = calculate_emissions()
+def plot_emissions_comparison(fig=None):
+    emis = BASELINE_EMISSIONS
 
-    fig, axes = plt.subplots(1, 2, figsize=(11, 5.5))
+    fig, axes = _subplots(fig, (11, 5.5), 1, 2)
 
     # Left: annual totals bar
     ax = axes[0]
@@ -311,7 +411,7 @@ def plot_emissions_comparison():
     values = [emis.diesel_annual_co2_tonnes, emis.h2_annual_co2_tonnes]
     colours = [PALETTE["orange"], PALETTE["blue"]]
     bars = ax.bar(categories, values, color=colours, width=0.45, zorder=3)
-    ax.bar_label(bars, fmt="%.0f t", padding=5, fontsize=11, fontweight="bold")
+    _label_bars(ax, bars, values, "%.0f t", padding=5, fontsize=11, fontweight="bold")
     ax.annotate(f"−{emis.co2_reduction_pct:.0f}%\n({emis.co2_saving_tonnes_yr:,.0f} t CO₂e saved)",
                 xy=(0.5, (emis.diesel_annual_co2_tonnes + emis.h2_annual_co2_tonnes) / 2),
                 xytext=(0.5, emis.diesel_annual_co2_tonnes * 0.6),
@@ -332,22 +432,21 @@ def plot_emissions_comparison():
     ]
     colours2 = [PALETTE["blue"], PALETTE["purple"], PALETTE["grey"]]
     bars2 = ax2.barh(components, ef_values, color=colours2, height=0.45, zorder=3)
-    ax2.bar_label(bars2, fmt="%.3f kg", padding=4, fontsize=10)
+    _label_bars(ax2, bars2, ef_values, "%.3f kg", padding=4, horizontal=True, fontsize=10)
     ax2.set_xlabel("Emission Factor  (kg CO₂e / kg H₂)")
     ax2.set_title("H₂ Pathway Emission Factor Breakdown")
     ax2.set_xlim(0, max(ef_values) * 1.3)
     ax2.grid(axis="y", visible=False)
 
-    fig.tight_layout()
     _savefig(fig, "emissions_comparison.png")
 
 
 # ── Figure 8: CAPEX Breakdown ─────────────────────────────────────────────────
 
-def plot_capex_breakdown():
-    cap = calculate_capex()
+def plot_capex_breakdown(fig=None):
+    cap = BASELINE_CAPEX
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
+    fig, ax = _subplots(fig, (9, 5.5))
     components = [
         "Electrolyser\nequipment",
         "BoP &\ninstallation",
@@ -360,7 +459,7 @@ def plot_capex_breakdown():
     ]
     colours = [PALETTE["blue"], PALETTE["light_blue"], PALETTE["orange"]]
     bars = ax.bar(components, values, color=colours, width=0.5, zorder=3, edgecolor="white")
-    ax.bar_label(bars, fmt="£%.2fM", padding=5, fontsize=11, fontweight="bold")
+    _label_bars(ax, bars, values, "£%.2fM", padding=5, fontsize=11, fontweight="bold")
 
     # Total line annotation
     total = cap.total_capex_gbp / 1e6
@@ -372,21 +471,20 @@ def plot_capex_breakdown():
     ax.set_title("Infrastructure CAPEX Breakdown")
     ax.set_ylim(0, total * 1.25)
     ax.grid(axis="x", visible=False)
-    fig.tight_layout()
     _savefig(fig, "capex_breakdown.png")
 
 
 # ── Figure 9: Tornado Chart (LCOH sensitivity) ────────────────────────────────
 
-def plot_tornado_lcoh():
+def plot_tornado_lcoh(fig=None):
     """
     One-at-a-time sensitivity: each parameter varied ±20% from baseline.
-    Uses explicit override kwargs in calculate_lcoh — avoids the Python
-    'from ... import' local-binding issue that makes monkey-patching ineffective.
+    All 14 scenarios come from one broadcast calculate_lcoh_vec call, with the
+    columns of a (scenario, parameter) matrix as the override kwargs.
     """
-    baseline_lcoh = calculate_lcoh().total_dispensed_cost_gbp_kg
+    baseline_lcoh = BASELINE_LCOH.total_dispensed_cost_gbp_kg
 
-    # Each entry: (display label, kwarg name in calculate_lcoh, baseline value)
+    # Each entry: (display label, kwarg name in calculate_lcoh_vec, baseline value)
     params = [
         ("Electricity price",       "electricity_price_gbp_mwh",        ELECTRICITY_PRICE_GBP_MWH),
         ("Electrolyser efficiency", "electrolyser_efficiency_kwh_kg",    ELECTROLYSER_EFFICIENCY_KWH_KG),
@@ -397,20 +495,29 @@ def plot_tornado_lcoh():
         ("Discount rate",           "discount_rate",                     DISCOUNT_RATE),
     ]
 
-    results = []
-    for label, kwarg, base_val in params:
-        low_val  = calculate_lcoh(**{kwarg: base_val * 0.80}).total_dispensed_cost_gbp_kg
-        high_val = calculate_lcoh(**{kwarg: base_val * 1.20}).total_dispensed_cost_gbp_kg
-        results.append((label, low_val - baseline_lcoh, high_val - baseline_lcoh))
-
-    # Sort by total swing (largest impact at top)
-    results.sort(key=lambda x: abs(x[2] - x[1]), reverse=True)
+    # All 14 perturbations in one broadcast call: scenario k scales one parameter
+    # by 0.8 (first n rows) or 1.2 (last n rows) and leaves the rest at baseline
+    n = len(params)
+    base = np.array([base_val for _, _, base_val in params])
+    scale = np.ones((2 * n, n))
+    scale[np.arange(n), np.arange(n)] = 0.80
+    scale[n + np.arange(n), np.arange(n)] = 1.20
+    scenarios = scale * base
+    totals = calculate_lcoh_vec(
+        **{kwarg: scenarios[:, j] for j, (_, kwarg, _) in enumerate(params)}
+    )["total_dispensed_cost_gbp_kg"]
+    low_deltas  = totals[:n] - baseline_lcoh
+    high_deltas = totals[n:] - baseline_lcoh
+    results = [(label, lo, hi) for (label, _, _), lo, hi in zip(params, low_deltas, high_deltas)]
+
+    # Sort by total swing (largest impact at top); exact ties keep list order
+    results.sort(key=lambda x: round(abs(x[2] - x[1]), 9), reverse=True)
 
     labels = [r[0] for r in results]
     lows   = [r[1] for r in results]
     highs  = [r[2] for r in results]
 
-    fig, ax = plt.subplots(figsize=(9, 5.5))
+    fig, ax = _subplots(fig, (9, 5.5))
     y = np.arange(len(labels))
 
     for i, (lo, hi) in enumerate(zip(lows, highs)):
@@ -434,28 +541,66 @@ def plot_tornado_lcoh():
     )
 
     # Custom legend
-    from matplotlib.patches import Patch
     ax.legend(handles=[
         Patch(color=PALETTE["red"],   alpha=0.82, label="Increases LCOH (+20%)"),
         Patch(color=PALETTE["green"], alpha=0.82, label="Decreases LCOH (+20%)"),
     ], fontsize=9, loc="lower right")
 
-    fig.tight_layout()
     _savefig(fig, "lcoh_sensitivity_tornado.png")
 
 
 # ── Runner ─────────────────────────────────────────────────────────────────────
 
-def generate_all_figures():
+PLOTS = (
+    plot_lcoh_vs_electricity,
+    plot_annual_cost_vs_electricity,
+    plot_breakeven_diesel,
+    plot_npv_vs_electricity,
+    plot_irr_vs_electricity,
+    plot_npv_heatmap,
+    plot_emissions_comparison,
+    plot_capex_breakdown,
+    plot_tornado_lcoh,
+)
+
+
+# Settings a caller may change before generate_all_figures. Pool workers get them
+# explicitly: under spawn/forkserver they re-import the module with the defaults.
+_WORKER_SETTINGS = ("OUTPUT_DIR", "SAVE_WEBP", "PNG_COMPRESS_LEVEL")
+
+def _init_worker(settings: dict):
+    globals().update(settings)
+    _set_style()
+
+def _render(plot) -> str:
+    """Worker task: draw one figure and return its console output."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        plot()
+    return buf.getvalue()
+
+
+def generate_all_figures(max_workers: Optional[int] = None):
+    """
+    Render every figure in PLOTS. The figures are independent, so by default
+    they are spread over up to one process per figure; max_workers=1 draws
+    them in-process on a single reused Figure.
+    """
     _set_style()
+    _output_dir()
     print("Generating figures...")
-    plot_lcoh_vs_electricity()
-    plot_annual_cost_vs_electricity()
-    plot_breakeven_diesel()
-    plot_npv_vs_electricity()
-    plot_irr_vs_electricity()
-    plot_npv_heatmap()
-    plot_emissions_comparison()
-    plot_capex_breakdown()
-    plot_tornado_lcoh()
-    print(f"\nAll figures saved to ./{OUTPUT_DIR}/")
+    if max_workers is None:
+        max_workers = min(len(PLOTS), os.cpu_count() or 1)
+
+    if max_workers > 1:
+        settings = {name: globals()[name] for name in _WORKER_SETTINGS}
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(settings,)) as pool:
+            # map() yields in submission order, so the log matches a serial run
+            for output in pool.map(_render, PLOTS):
+                sys.stdout.write(output)
+    else:
+        fig = _figure()  # one figure, cleared and reused by every plot
+        for plot in PLOTS:
+            plot(fig=fig)
+    print(f"\nAll figures saved to {os.path.join(os.curdir, OUTPUT_DIR)}/")
@@ -0,0 +1,47 @@
+"""
+calculate_annual_costs with a non-default DemandResults: every fleet-sized
+quantity (H2 volume, displaced diesel, CO2 saved) must follow the fleet.
+"""
+
+import pytest
+
+from src.parameters import TOTAL_BUSES
+from src.demand import DEFAULT_DEMAND, calculate_demand
+from src.economics import calculate_annual_costs, calculate_npv_irr
+from src.emissions import calculate_emissions
+
+
+def test_default_demand_is_the_implicit_baseline():
+    assert calculate_annual_costs(demand=DEFAULT_DEMAND) == calculate_annual_costs()
+    assert calculate_emissions(demand=DEFAULT_DEMAND) == calculate_emissions()
+
+
+@pytest.mark.parametrize("total_buses", [70, 200])
+def test_fleet_size_scales_both_sides(total_buses):
+    base = calculate_annual_costs()
+    costs = calculate_annual_costs(demand=calculate_demand(total_buses=total_buses))
+    ratio = total_buses / TOTAL_BUSES
+
+    # At a fixed dispensed price and emission factor, everything is proportional to fleet size
+    for field in ("h2_fuel_cost_gbp", "diesel_fuel_cost_gbp", "fuel_saving_gbp",
+                  "carbon_saving_tonnes", "carbon_saving_value_gbp", "total_annual_benefit_gbp"):
+        assert getattr(costs, field) == pytest.approx(getattr(base, field) * ratio, rel=1e-12), field
+
+    npv = calculate_npv_irr(costs=costs)
+    assert npv.annual_benefit_gbp == pytest.approx(base.total_annual_benefit_gbp * ratio, rel=1e-12)
+
+
+def test_emissions_follow_demand():
+    base = calculate_emissions()
+    bigger = calculate_emissions(demand=calculate_demand(total_buses=200))
+    ratio = 200 / TOTAL_BUSES
+    assert bigger.total_h2_ef_kg_kgh2 == base.total_h2_ef_kg_kgh2
+    assert bigger.diesel_annual_co2_tonnes == pytest.approx(base.diesel_annual_co2_tonnes * ratio, rel=1e-12)
+    assert bigger.co2_saving_tonnes_yr == pytest.approx(base.co2_saving_tonnes_yr * ratio, rel=1e-12)
+    assert bigger.co2_reduction_pct == pytest.approx(base.co2_reduction_pct, rel=1e-12)
+
+
+def test_explicit_emissions_take_precedence():
+    emis = calculate_emissions(0.0)
+    costs = calculate_annual_costs(demand=calculate_demand(total_buses=200), emis=emis)
+    assert costs.carbon_saving_tonnes == emis.co2_saving_tonnes_yr
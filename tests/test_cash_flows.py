@@ -0,0 +1,116 @@
+"""
+Cash-flow kernels behind calculate_npv_irr: Horner NPV and the IRR solvers.
+Run with and without numba installed; both builds must agree.
+"""
+
+import numpy as np
+import pytest
+
+from src.economics import (
+    _npv, _npv_and_slope,
+    _irr, _irr_newton, _irr_numba, _annuity_irr, _annuity_irr_vec,
+)
+
+RNG = np.random.default_rng(7)
+
+
+def _direct_npv(cash_flows, rate):
+    years = np.arange(len(cash_flows))
+    return float(np.sum(cash_flows / (1 + rate) ** years))
+
+
+def _irregular_cash_flows(n=200):
+    for _ in range(n):
+        cf = RNG.uniform(-1e6, 3e6, int(RNG.integers(3, 30)))
+        cf[0] = -RNG.uniform(1e6, 2e7)
+        yield cf
+
+
+@pytest.mark.parametrize("rate", [-0.3, 0.0, 0.08, 0.5, 1.5])
+def test_npv_matches_direct_sum(rate):
+    for cf in _irregular_cash_flows(50):
+        assert _npv(cf, rate) == pytest.approx(_direct_npv(cf, rate), rel=1e-10, abs=1e-3)
+
+
+def test_npv_slope_matches_finite_difference():
+    h = 1e-6
+    for cf in _irregular_cash_flows(50):
+        npv, slope = _npv_and_slope(cf, 0.08)
+        assert npv == pytest.approx(_npv(cf, 0.08), rel=1e-10, abs=1e-3)
+        numeric = (_npv(cf, 0.08 + h) - _npv(cf, 0.08 - h)) / (2 * h)
+        assert slope == pytest.approx(numeric, rel=1e-5)
+
+
+def _bisect_irr(cash_flows, lo=-0.5, hi=2.0):
+    # Reference root: plain bisection to machine precision
+    f_lo = _direct_npv(cash_flows, lo)
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        f_mid = _direct_npv(cash_flows, mid)
+        if f_lo * f_mid <= 0:
+            hi = mid
+        else:
+            lo, f_lo = mid, f_mid
+    return (lo + hi) / 2
+
+
+def _single_root_cash_flows(n=200):
+    # One outlay then uneven positive benefits: NPV falls monotonically, one IRR
+    for _ in range(n):
+        cf = RNG.uniform(1e5, 3e6, int(RNG.integers(3, 30)))
+        cf[0] = -RNG.uniform(1e6, 2e7)
+        if _direct_npv(cf, -0.5) * _direct_npv(cf, 2.0) < 0:
+            yield cf
+
+
+def test_irr_of_irregular_cash_flows_matches_bisection():
+    for cf in _single_root_cash_flows():
+        expected = _bisect_irr(cf)
+        assert _irr(cf) == pytest.approx(expected, abs=1e-6)
+        assert _irr_numba(cf, -0.5, 2.0) == pytest.approx(expected, abs=1e-6)
+
+
+def test_irr_newton_converges_or_signals_nan():
+    for cf in _single_root_cash_flows(50):
+        r = _irr_newton(cf, 0.1, -0.5, 2.0)
+        if not np.isnan(r):
+            assert abs(_npv(cf, r)) < 1.0
+            assert r == pytest.approx(_bisect_irr(cf), abs=1e-6)
+
+
+def test_irr_without_sign_change_is_none():
+    irregular = np.array([-1e7, 1.0, 2.0, 3.0])  # never recovers the outlay
+    assert _irr(irregular) is None
+    assert np.isnan(_irr_numba(irregular, -0.5, 2.0))
+
+    level = np.array([-1e7, 1.0, 1.0, 1.0])
+    assert _irr(level) is None
+    assert _annuity_irr(1e7, 1.0, 3) is None
+    assert _annuity_irr(1e7, 0.0, 3) is None
+    assert _annuity_irr(1e7, -5e5, 3) is None
+
+
+@pytest.mark.parametrize("n_years", [1, 5, 20, 40])
+def test_level_cash_flows_take_the_annuity_path(n_years):
+    for benefit in (2e5, 1e6, 3e6, 1.5e7):
+        cf = np.full(n_years + 1, benefit)
+        cf[0] = -1e7
+        expected = _annuity_irr(1e7, benefit, n_years)
+        assert _irr(cf) == expected
+        if expected is None:
+            assert np.isnan(_irr_numba(cf, -0.5, 2.0))
+        else:
+            assert expected == pytest.approx(_bisect_irr(cf), abs=1e-9)
+            assert _irr_numba(cf, -0.5, 2.0) == pytest.approx(expected, abs=1e-6)
+
+
+def test_annuity_irr_vec_matches_scalar():
+    benefits = np.concatenate([[-1e6, 0.0, 1.0], np.linspace(2e5, 2e7, 97)])
+    for n_years in (1, 20):
+        vec = _annuity_irr_vec(1e7, benefits, n_years)
+        for benefit, r in zip(benefits, vec):
+            expected = _annuity_irr(1e7, benefit, n_years)
+            if expected is None:
+                assert np.isnan(r), benefit
+            else:
+                assert r == pytest.approx(expected, abs=1e-11), benefit
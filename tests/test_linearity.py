@@ -0,0 +1,69 @@
+"""
+The sensitivity figures sample electricity price coarsely (LINEAR_ELEC_GRID,
+21 points; NPV heatmap, 26 x 26) because those curves are exactly affine in
+electricity price and NPV is bilinear in (electricity, carbon) price. These
+tests fail if a nonlinear term (a clip, a tariff step) breaks that assumption.
+"""
+
+import numpy as np
+import pytest
+
+from src.parameters import (
+    ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH,
+    CARBON_PRICE_MIN, CARBON_PRICE_MAX,
+)
+from src.economics import (
+    calculate_lcoh_vec,
+    calculate_annual_costs_vec,
+    calculate_npv_vec,
+    diesel_breakeven_price_vec,
+)
+
+ELEC = np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 400)
+TOL = 1e-9
+
+
+def _max_residual(design: np.ndarray, y: np.ndarray) -> float:
+    # Least-squares fit, residual relative to the curve's magnitude (NPVs are ~£1e7)
+    y = np.broadcast_to(y, design.shape[:1])
+    coef, *_ = np.linalg.lstsq(design, y, rcond=None)
+    return np.max(np.abs(y - design @ coef)) / max(np.max(np.abs(y)), 1.0)
+
+
+def _affine_residual(y: np.ndarray) -> float:
+    return _max_residual(np.column_stack([np.ones_like(ELEC), ELEC]), y)
+
+
+@pytest.mark.parametrize("field", [
+    "electricity_cost_gbp_kg", "capex_amortised_gbp_kg", "opex_non_energy_gbp_kg",
+    "stack_replacement_gbp_kg", "transport_gbp_kg", "hrs_opex_gbp_kg",
+    "total_dispensed_cost_gbp_kg",
+])
+def test_lcoh_affine_in_electricity_price(field):
+    assert _affine_residual(calculate_lcoh_vec(ELEC)[field]) < TOL
+
+
+def test_annual_costs_affine_in_electricity_price():
+    for field, values in calculate_annual_costs_vec(ELEC).items():
+        assert _affine_residual(values) < TOL, field
+
+
+@pytest.mark.parametrize("carbon_price", [0.0, 50.0, 100.0, 200.0])
+def test_npv_affine_in_electricity_price(carbon_price):
+    assert _affine_residual(calculate_npv_vec(ELEC, carbon_price)["npv_gbp"]) < TOL
+
+
+@pytest.mark.parametrize("carbon_price", [0.0, 50.0, 100.0, 150.0])
+def test_breakeven_affine_in_electricity_price(carbon_price):
+    assert _affine_residual(diesel_breakeven_price_vec(ELEC, carbon_price)) < TOL
+
+
+def test_npv_bilinear_in_electricity_and_carbon_price():
+    elec, carbon = np.meshgrid(
+        np.linspace(ELEC_PRICE_MIN_GBP_MWH, ELEC_PRICE_MAX_GBP_MWH, 60),
+        np.linspace(CARBON_PRICE_MIN, CARBON_PRICE_MAX, 60),
+    )
+    npv = calculate_npv_vec(elec, carbon)["npv_gbp"].ravel()
+    elec, carbon = elec.ravel(), carbon.ravel()
+    design = np.column_stack([np.ones_like(elec), elec, carbon, elec * carbon])
+    assert _max_residual(design, npv) < TOL
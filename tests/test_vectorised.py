@@ -0,0 +1,115 @@
+"""
+Every *_vec function must reproduce its memoised scalar calculator
+point by point; the figures use the vectorised forms, main.py the scalar ones.
+"""
+
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from src.economics import (
+    calculate_lcoh, calculate_lcoh_vec, calculate_lcoh_batch, specialize_lcoh,
+    calculate_annual_costs, calculate_annual_costs_vec,
+    calculate_npv_irr, calculate_npv_vec, calculate_irr_vec,
+    diesel_breakeven_price, diesel_breakeven_price_vec,
+)
+from src.emissions import calculate_emissions, calculate_emissions_vec
+
+# 250 £/MWh lies past the breakeven, so the grid includes points with no IRR
+ELEC = np.array([20.0, 45.0, 57.0, 90.0, 120.0, 250.0])
+CARBON = np.array([0.0, 50.0, 150.0])
+RTOL = 1e-12
+
+
+def _assert_fields_match(vec: dict, scalar_at, shape):
+    for index in np.ndindex(shape):
+        for field, value in asdict(scalar_at(index)).items():
+            if field in vec:
+                assert vec[field][index] == pytest.approx(value, rel=RTOL, abs=1e-9), (field, index)
+
+
+def test_lcoh_vec_matches_scalar():
+    _assert_fields_match(calculate_lcoh_vec(ELEC), lambda i: calculate_lcoh(ELEC[i]), ELEC.shape)
+
+
+def test_lcoh_vec_matches_scalar_with_overrides():
+    kwargs = dict(discount_rate=0.06, electrolyser_efficiency_kwh_kg=52.0,
+                  electrolyser_cost_per_kw=900.0, bop_fraction=0.3,
+                  transport_cost_gbp_kg=0.8, hrs_opex_gbp_kg_override=1.1)
+    _assert_fields_match(calculate_lcoh_vec(ELEC, **kwargs),
+                         lambda i: calculate_lcoh(ELEC[i], **kwargs), ELEC.shape)
+
+
+# One short sweep per calculate_lcoh parameter; the discount rates include zero
+SWEEPS = {
+    "electricity_price_gbp_mwh":      ELEC,
+    "discount_rate":                  np.array([0.0, 0.04, 0.08, 0.12]),
+    "electrolyser_efficiency_kwh_kg": np.array([45.0, 52.0, 60.0]),
+    "electrolyser_cost_per_kw":       np.array([700.0, 1000.0, 1400.0]),
+    "bop_fraction":                   np.array([0.2, 0.3, 0.4]),
+    "transport_cost_gbp_kg":          np.array([0.5, 0.8, 1.2]),
+    "hrs_opex_gbp_kg_override":       np.array([0.8, 1.1, 1.5]),
+}
+
+
+@pytest.mark.parametrize("param_name", SWEEPS)
+def test_lcoh_batch_matches_scalar(param_name):
+    values = SWEEPS[param_name]
+    batch = calculate_lcoh_batch(param_name, values)
+    _assert_fields_match(batch, lambda i: calculate_lcoh(**{param_name: values[i]}), values.shape)
+
+
+def test_lcoh_batch_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        calculate_lcoh_batch("electricity_price", ELEC)
+
+
+@pytest.mark.parametrize("param_name", SWEEPS)
+def test_specialized_lcoh_matches_scalar(param_name):
+    values = SWEEPS[param_name]
+    lcoh_at = specialize_lcoh(param_name)
+    expected = [calculate_lcoh(**{param_name: v}).total_dispensed_cost_gbp_kg for v in values]
+    # Folding the other terms into base + slope reorders the sum: rounding-level drift
+    assert lcoh_at(values) == pytest.approx(expected, rel=1e-12)
+    assert [lcoh_at(v) for v in values] == pytest.approx(expected, rel=1e-12)
+
+
+def test_specialize_lcoh_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        specialize_lcoh("electricity_price")
+
+
+def test_emissions_vec_matches_scalar():
+    _assert_fields_match(calculate_emissions_vec(ELEC),
+                         lambda i: calculate_emissions(ELEC[i]), ELEC.shape)
+
+
+def test_annual_costs_vec_matches_scalar():
+    vec = calculate_annual_costs_vec(ELEC[None, :], CARBON[:, None])
+    _assert_fields_match(vec, lambda i: calculate_annual_costs(ELEC[i[1]], CARBON[i[0]]),
+                         (len(CARBON), len(ELEC)))
+
+
+def test_npv_vec_matches_scalar():
+    vec = calculate_npv_vec(ELEC[None, :], CARBON[:, None])
+    _assert_fields_match(vec, lambda i: calculate_npv_irr(ELEC[i[1]], CARBON[i[0]]),
+                         (len(CARBON), len(ELEC)))
+
+
+def test_irr_vec_matches_scalar():
+    vec = calculate_irr_vec(ELEC[None, :], CARBON[:, None])
+    for (c, e), irr in np.ndenumerate(vec):
+        expected = calculate_npv_irr(ELEC[e], CARBON[c]).irr_pct
+        if expected is None:
+            assert np.isnan(irr), (c, e)
+        else:
+            # Both annuity iterations stop on a 1e-12 step in the rate
+            assert irr == pytest.approx(expected, abs=1e-9), (c, e)
+    assert np.isnan(vec).any() and not np.isnan(vec).all()
+
+
+def test_breakeven_vec_matches_scalar():
+    vec = diesel_breakeven_price_vec(ELEC[None, :], CARBON[:, None])
+    for (c, e), price in np.ndenumerate(vec):
+        assert price == pytest.approx(diesel_breakeven_price(ELEC[e], CARBON[c]), rel=RTOL)